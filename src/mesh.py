@@ -1,12 +1,18 @@
 import csv
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit, prange = None, None
+
 
 class Mesh:
     """ Contains information and functionality for a 3D mesh.
 
     Attributes:
-        vertices (ndarray): 3 x V array, where V is the number of vertices.
+        vertices (ndarray): V x 3 array, where V is the number of vertices. Each row is a vertex, so the
+            coordinates of a vertex are contiguous in memory.
         num_vertices (int): Number of vertices in the Mesh.
         faces (ndarray): F x 3 array, where F is the number of faces. Each row represents a face, containing the three
             indices for the three vertices that the face consists of.
@@ -20,45 +26,45 @@ class Mesh:
         """ Initializes the Mesh by reading its information from a provided csv file.
 
         Args:
-            vertices (ndarray): 3 x V array, where V is the number of vertices.
+            vertices (ndarray): V x 3 array, where V is the number of vertices.
             faces (ndarray): F x 3 array, where F is the number of faces. Each row represents a face, containing the three
                 indices for the three vertices that the face consists of.
         """
         self.vertices = vertices
-        self.num_vertices = vertices.shape[1]
+        self.num_vertices = vertices.shape[0]
         self.faces = faces
         self.num_faces = faces.shape[0]
         self.edge_indices = self.compute_edge_indices()
+        self._R = np.empty((3, 3), dtype=vertices.dtype)
+        self._scratch = np.empty_like(vertices)
+        self._edge_xy = np.empty((2, 2, self.edge_indices.shape[0]), dtype=vertices.dtype)
 
     def compute_edge_indices(self):
         """ Finds the unique set of edges for the 3D mesh.
 
-        Args:
-            faces (ndarray): Faces of the Mesh, with shape (F x 3), where F = number of faces and
-                each row contains three indices for the vertices that make up the face.
-
         Returns:
-            List containing the set of unique edges for the mesh. Each edge consists of a Tuple that has the index for
-                the starting vertex and index for the ending vertex for the edge.
+            ndarray of shape (E x 2), where E is the number of unique edges in the mesh. Each row contains the index
+                for the starting vertex and index for the ending vertex of the edge.
 
         """
         assert self.faces.shape == (self.num_faces, 3), 'Faces must have dimensions F x 3'
-        edge_indices = set()
-        for face in self.faces:
-            edge_indices.add((face[0], face[1]))
-            edge_indices.add((face[0], face[2]))
-            edge_indices.add((face[1], face[2]))
-        return list(edge_indices)
+        edges = np.concatenate([self.faces[:, [0, 1]], self.faces[:, [0, 2]], self.faces[:, [1, 2]]], axis=0)
+        edges.sort(axis=1)
+        return np.unique(edges, axis=0)
 
     def rotate(self, R):
         """ Rotates the mesh according to provided rotation matrix.
 
+        The rotated vertices are written into a preallocated scratch buffer which is then swapped with the
+        vertices, so rotating does not allocate a new (V, 3) array on every mouse motion event.
+
         Args:
             R (ndarray): 3x3 rotation matrix that is orthogonal and determinant 1.
 
         """
         assert R.shape == (3, 3), 'The rotation matrix must have shape (3,3)'
-        self.vertices = np.matmul(R, self.vertices)
+        np.matmul(self.vertices, R.T, out=self._scratch)
+        self.vertices, self._scratch = self._scratch, self.vertices
 
     def rotate_about_x_and_y(self, degrees_about_x, degrees_about_y):
         """ Rotates the mesh about the x and y axes.
@@ -66,6 +72,8 @@ class Mesh:
         The x-axis points to the right in the figure, and the y-axis points upwards. This uses a rotation
         matrix that is the matrix multiplication of a rotation matrix for rotation about the x-axis and a
         rotation matrix for rotation about the y-axis. The final rotation matrix was calculated symbolically by hand.
+        Since this runs on every mouse motion event, the matrix entries are written into a preallocated buffer
+        instead of constructing a new array each call.
 
         Args:
             degrees_about_x (float): Degrees to rotate about the x-axis
@@ -76,15 +84,29 @@ class Mesh:
         s_y, c_y = np.sin(radians_about_y), np.cos(radians_about_y)
         s_x, c_x = np.sin(radians_about_x), np.cos(radians_about_x)
 
-        R = np.array([[c_y, s_y * s_x, s_y * c_x],
-                      [0, c_x, -s_x],
-                      [-s_y, c_y * s_x, c_y * c_x]])
+        R = self._R
+        R[0, 0] = c_y
+        R[0, 1] = s_y * s_x
+        R[0, 2] = s_y * c_x
+        R[1, 0] = 0
+        R[1, 1] = c_x
+        R[1, 2] = -s_x
+        R[2, 0] = -s_y
+        R[2, 1] = c_y * s_x
+        R[2, 2] = c_y * c_x
 
         self.rotate(R)
 
-    def get_projected_edges(self):
+    def get_projected_edges(self, projected_vertices=None):
         """ Get start and end positions for the Mesh's edges projected onto a 2D plane an infinite distance away.
 
+        The returned arrays are views into a preallocated buffer that is overwritten on every call, so this
+        does not allocate per frame; callers should not hold onto the previous frame's result.
+
+        Args:
+            projected_vertices (ndarray): Optional (V x 2) array of already-projected vertices, so callers that
+                also need the projection elsewhere in the same frame can share one view instead of recomputing it.
+
         Returns:
             Tuple of two entries: (x, y), where x and y have shape 2 x E. Each column in x and y represents
                 the x / y coordinates of the start and end of the edge.
@@ -100,38 +122,27 @@ class Mesh:
                 represents three edges, where the first edge goes from (1, 7) to (4, 8)
 
         """
-        projected_vertices = self.project_vertices_onto_window()
-        x, y = [], []
-        for edge in self.edge_indices:
-            x.append((projected_vertices[:, edge[0]][0], projected_vertices[:, edge[1]][0]))
-            y.append((projected_vertices[:, edge[0]][1], projected_vertices[:, edge[1]][1]))
-        return np.array(x).T, np.array(y).T
+        if projected_vertices is None:
+            projected_vertices = self.project_vertices_onto_window()
+        x, y = self._edge_xy
+        np.take(projected_vertices[:, 0], self.edge_indices[:, 0], out=x[0])
+        np.take(projected_vertices[:, 0], self.edge_indices[:, 1], out=x[1])
+        np.take(projected_vertices[:, 1], self.edge_indices[:, 0], out=y[0])
+        np.take(projected_vertices[:, 1], self.edge_indices[:, 1], out=y[1])
+        return x, y
 
     def center_at_origin(self):
         """ Centers the mesh at the origin """
-        center = self._get_center_repeated_matrix()
-        self.vertices -= center
-
-    def _get_center_repeated_matrix(self):
-        """ Get a repeated matrix of the center coordinates.
-
-        Returns:
-            ndarray of shape (3 x V), where V = number of vertices. Each column in the matrix is the
-            center of the mesh object.
-
-        """
-        center = self.get_center()
-        center = np.repeat(center, self.num_vertices, axis=1)
-        return center
+        self.vertices -= self.get_center()
 
     def get_center(self):
         """ Get the vector for the center of the mesh object.
 
         Returns:
-            ndarray of shape (3, 1) representing the center of the mesh object.
+            ndarray of shape (1, 3) representing the center of the mesh object.
         """
 
-        center = np.expand_dims(np.mean(self.vertices, axis=1), axis=1)
+        center = np.mean(self.vertices, axis=0, keepdims=True)
         return center
 
     def get_furthest_vertex_distance(self):
@@ -140,9 +151,8 @@ class Mesh:
         Returns:
             float for the furthest distance a vertex is from the center of the mesh object.
         """
-        center = self._get_center_repeated_matrix()
-        vertices = self.vertices - center
-        norms = np.linalg.norm(vertices, axis=0)
+        vertices = self.vertices - self.get_center()
+        norms = np.linalg.norm(vertices, axis=1)
         furthest_vector_distance = np.max(norms)
         return furthest_vector_distance
 
@@ -150,83 +160,102 @@ class Mesh:
         """ Projects the vertices of the Mesh onto a 2D plane an infinite distance away.
 
         Returns:
-            ndarray of shape (2 x V) for the 2D projected vertices, where V is the number of vertices in the Mesh.
+            ndarray of shape (V x 2) for the 2D projected vertices, where V is the number of vertices in the Mesh.
 
         """
-        projected_vertices = self.vertices[:2, :]
+        projected_vertices = self.vertices[:, :2]
         return projected_vertices
 
-    def get_projected_faces(self):
+    def get_projected_faces(self, projected_vertices=None):
         """ Get faces projected onto the 2D window.
 
+        Args:
+            projected_vertices (ndarray): Optional (V x 2) array of already-projected vertices, so callers that
+                also need the projection elsewhere in the same frame can share one view instead of recomputing it.
+
         Returns:
-            List[ndarray] with each ndarray being of shape (3x2), where each numpy array contains three 2D points.
+            ndarray of shape (F x 3 x 2), where each entry along the first axis contains the three 2D points
+                of the corresponding face.
         """
-        projected_vertices = self.project_vertices_onto_window()
-        face_polygons = [None] * self.num_faces
-        for i, face_vertex_indices in enumerate(self.faces):
-            face_polygon = projected_vertices[:, face_vertex_indices].T
-            face_polygons[i] = face_polygon
-        return face_polygons
+        if projected_vertices is None:
+            projected_vertices = self.project_vertices_onto_window()
+        return projected_vertices[self.faces]
 
     def get_face_z_values(self):
-        """ Get z values of the faces.
+        """ Get z values of the face centroids.
 
         Returns:
-            List[float] list of floats for distances for each face
+            ndarray of shape (F,) with the z-coordinate of each face's centroid.
 
         """
-        face_z_values = [0] * self.num_faces
-        for i, face_vertex_indices in enumerate(self.faces):
-            face = self.vertices[:, face_vertex_indices]
-            face_z_values[i] = self._compute_z_centroid_of_triangle(face)
-        return face_z_values
+        return self.vertices[self.faces, 2].mean(axis=1)
 
-    def _compute_centroid_of_triangle(self, triangle):
-        """ Compute the centroid of a 3D triangle
+    def get_face_render_quantities(self):
+        """ Get the per-face quantities needed to render the mesh: centroid z values and unit normals.
 
-        Args:
-            triangle (ndarray): Array of shape (3,3) representing the three points of a 3D triangle.
-                Each column is a 3D point, and the rows are the x, y, and z coordinates of the points
+        When numba is available, both quantities are computed by a single JIT-compiled pass over the faces, which
+        reads each face's vertices once instead of gathering them separately for each quantity. Otherwise this
+        falls back to the vectorized get_face_z_values and get_face_normals.
 
         Returns:
-            The triangle's centroid
+            Tuple of (face_z_values, normals), where face_z_values has shape (F,) and normals has shape (F, 3).
         """
-        assert triangle.shape == (3, 3), 'Argument triangle must have shape 3x3'
-        centroid = np.expand_dims(np.average(triangle, axis=1), axis=1)
-        return centroid
+        if njit is None:
+            return self.get_face_z_values(), self.get_face_normals()
+        face_z_values = np.empty(self.num_faces)
+        normals = np.empty((self.num_faces, 3))
+        _compute_face_quantities(self.vertices, self.faces, face_z_values, normals)
+        return face_z_values, normals
 
-    def _compute_z_centroid_of_triangle(self, triangle):
-        """ Compute the z centroid of a 3D triangle.
-        
-        Args:
-            triangle (ndarray): Array of shape (3,3) representing the three points of a 3D triangle.
-                Each column is a 3D point, and the rows are the x, y, and z coordinates of the points
+    def get_face_normals(self):
+        """ Get normal vectors for each face. Tries to get outward facing vectors, but this assumes the mesh is convex.
 
         Returns:
-            The z-coordinate of the triangle's centroid.
+            ndarray of shape (F, 3), where each row is the unit normal vector of the corresponding face.
         """
-        return self._compute_centroid_of_triangle(triangle)[2, 0]
+        face_vertices = self.vertices[self.faces]
+        normals = np.cross(face_vertices[:, 1] - face_vertices[:, 0], face_vertices[:, 2] - face_vertices[:, 0])
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        return normals
 
-    def get_face_normals(self):
-        """ Get normal vectors for each face. Tries to get outward facing vectors, but this assumes the mesh is convex.
 
-        Returns:
-            List[ndarray] of arrays with shape (3,), where each represents the normal vector of the corresponding face.
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compute_face_quantities(vertices, faces, face_z_values, normals):
+        """ Compute the centroid z value and unit normal of every face in one pass over the vertices.
+
+        Args:
+            vertices (ndarray): V x 3 array of vertex coordinates.
+            faces (ndarray): F x 3 array of vertex indices for each face.
+            face_z_values (ndarray): Output array of shape (F,) for the centroid z values.
+            normals (ndarray): Output array of shape (F, 3) for the unit normal vectors.
+
         """
-        normals = []
+        for i in prange(faces.shape[0]):
+            i0, i1, i2 = faces[i, 0], faces[i, 1], faces[i, 2]
 
-        for i, face_vertex_indices in enumerate(self.faces):
-            face = self.vertices[:, face_vertex_indices].T
-            face_plane_span_vector1 = face[1] - face[0]
-            face_plane_span_vector2 = face[2] - face[0]
+            face_z_values[i] = (vertices[i0, 2] + vertices[i1, 2] + vertices[i2, 2]) / 3.0
 
-            normal = np.expand_dims(np.cross(face_plane_span_vector1, face_plane_span_vector2), axis=1)
-            normal /= np.linalg.norm(normal)
+            a_x = vertices[i1, 0] - vertices[i0, 0]
+            a_y = vertices[i1, 1] - vertices[i0, 1]
+            a_z = vertices[i1, 2] - vertices[i0, 2]
+            b_x = vertices[i2, 0] - vertices[i0, 0]
+            b_y = vertices[i2, 1] - vertices[i0, 1]
+            b_z = vertices[i2, 2] - vertices[i0, 2]
 
-            normals.append(normal)
+            n_x = a_y * b_z - a_z * b_y
+            n_y = a_z * b_x - a_x * b_z
+            n_z = a_x * b_y - a_y * b_x
 
-        return normals
+            inverse_norm = 1.0 / np.sqrt(n_x * n_x + n_y * n_y + n_z * n_z)
+            normals[i, 0] = n_x * inverse_norm
+            normals[i, 1] = n_y * inverse_norm
+            normals[i, 2] = n_z * inverse_norm
+
+    # Warm-start the JIT compilation at import time, with the dtypes read_mesh_from_file produces, so the
+    # first rendered frame does not pay for it.
+    _compute_face_quantities(np.eye(3, dtype=np.float32), np.array([[0, 1, 2]], dtype=np.int32),
+                             np.empty(1), np.empty((1, 3)))
 
 
 def read_mesh_from_file(filepath):
@@ -240,31 +269,17 @@ def read_mesh_from_file(filepath):
 
     """
     with open(filepath, 'r') as f:
-        reader = csv.reader(f)
-        first_row = reader.__next__()
+        first_row = csv.reader(f).__next__()
         num_vertices = int(first_row[0])
         num_faces = int(first_row[1])
 
-        vertices = []
-        for i in range(num_vertices):
-            vertex = reader.__next__()
-            vertex = list(map(float, vertex))[1:]
-            vertices.append(vertex)
-        vertices = np.array(vertices).T
-
-        faces = []
-        for i in range(num_faces):
-            face = reader.__next__()
-            face = list(map(int, face))
-            face = list(map(vertex_id_to_index, face))
-            faces.append(face)
-        faces = np.array(faces)
+    vertices = np.loadtxt(filepath, delimiter=',', skiprows=1, max_rows=num_vertices, usecols=(1, 2, 3), ndmin=2)
+    faces = np.loadtxt(filepath, delimiter=',', dtype=np.int32, skiprows=1 + num_vertices, max_rows=num_faces, ndmin=2)
 
-    return Mesh(vertices, faces)
+    # float32 is plenty of precision for display and halves the memory traffic of every per-frame operation.
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32)
 
+    assert faces.min() >= 1, 'Vertex ids should range from 1 to V, where V is the number of vertices'
+    faces -= 1
 
-def vertex_id_to_index(vertex_id):
-    """ Converts from vertex_id to zero-based index """
-    assert 1 <= vertex_id, 'Vertex id should range from 1 to V, where V is the number of vertices'
-    index = vertex_id - 1
-    return index
+    return Mesh(vertices, faces)
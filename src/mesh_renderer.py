@@ -1,7 +1,5 @@
 from mesh import Mesh, read_mesh_from_file
 from window import Window
-from matplotlib.animation import FuncAnimation
-import matplotlib.pyplot as plt
 import argparse
 import os
 
@@ -17,8 +15,14 @@ class MeshRendererApp:
         degrees_per_full_screen_mouse_move (float): Degrees to rotate the mesh by after the mouse has moved the full
             length of the figure.
 
+    Mouse motion events can arrive faster than the mesh can be rotated and redrawn, so motion events only
+    accumulate the drag displacement; a timer applies the pending displacement and redraws at roughly 60 Hz.
+    This caps the work done at the displayed frame rate no matter how fast events fire.
+
     """
 
+    REDRAW_INTERVAL_MS = 16
+
     def __init__(self, filepath, wireframe=False, degrees_per_full_screen_mouse_move=200):
         """ Initializes the rendering application.
 
@@ -36,6 +40,8 @@ class MeshRendererApp:
         self.wireframe = wireframe
 
         self.window = Window(window_limit)
+        self.window.plot_mesh(self.mesh, draw_faces=(not self.wireframe))
+        self.window.enable_blitting()
 
         self._connect()
 
@@ -44,25 +50,27 @@ class MeshRendererApp:
 
         self.degrees_per_full_screen_mouse_move = degrees_per_full_screen_mouse_move
 
-    def update(self, i):
-        """ Update the rendering by clearing the window and plotting the mesh again.
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._dirty = False
+        self._timer = self.window.fig.canvas.new_timer(interval=self.REDRAW_INTERVAL_MS)
+        self._timer.add_callback(self._apply_pending_motion)
+        self._timer.start()
 
-        Args:
-            i (int): Current frame number of the animation.
+    def update(self):
+        """ Update the rendering by updating the mesh artists and blitting them onto the window.
+
+        Only runs when there is pending mouse motion, so the application does no work while the mouse is idle.
+        See https://matplotlib.org/stable/users/explain/animations/blitting.html for more information on
+        blitting.
 
         """
-        self.window.clear()
         self.window.plot_mesh(self.mesh, draw_faces=(not self.wireframe))
+        self.window.blit_mesh()
 
     def run(self):
-        """ Runs an animation to render the Mesh and update the display, and displays the window to the user.
-
-        See https://matplotlib.org/stable/api/_as_gen/matplotlib.animation.FuncAnimation.html for more information.
-
-        """
-
+        """ Displays the window to the user. """
         print("Press 'q' to quit the application")
-        animation = FuncAnimation(plt.gcf(), self.update, interval=1, repeat=True)
         self.window.show()
 
     def _connect(self):
@@ -121,22 +129,38 @@ class MeshRendererApp:
         if current_mouse_x is None or current_mouse_y is None:
             return
 
-        self.rotate_mesh_based_on_mouse_move(current_mouse_x, current_mouse_y)
-        self.mesh.center_at_origin()
+        self._pending_dx += current_mouse_x - self.last_mouse_drag_location[0]
+        self._pending_dy += current_mouse_y - self.last_mouse_drag_location[1]
+        self._dirty = True
         self.last_mouse_drag_location = (current_mouse_x, current_mouse_y)
 
-    def rotate_mesh_based_on_mouse_move(self, current_mouse_x, current_mouse_y, movement_factor=100):
-        """ Rotates the mesh based on the mouse movement.
+    def _apply_pending_motion(self):
+        """ Applies the accumulated mouse drag displacement and redraws, if any motion is pending.
 
-        Args:
-            current_mouse_x (int): Current x-location of the mouse in pixels.
-            current_mouse_y (int): Current y-location of the mouse in pixels.
-            movement_factor (float): Scales how much rotation occurs for a mouse movement.
+        Runs on the redraw timer, so a burst of motion events between two frames results in a single rotation
+        and a single redraw.
 
         """
-        x_displacement = current_mouse_x - self.last_mouse_drag_location[0]
-        y_displacement = current_mouse_y - self.last_mouse_drag_location[1]
+        if not self._dirty:
+            return
+
+        x_displacement, y_displacement = self._pending_dx, self._pending_dy
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._dirty = False
+
+        self.rotate_mesh_from_displacement(x_displacement, y_displacement)
+        self.mesh.center_at_origin()
+        self.update()
 
+    def rotate_mesh_from_displacement(self, x_displacement, y_displacement):
+        """ Rotates the mesh based on a mouse drag displacement.
+
+        Args:
+            x_displacement (int): How far the mouse was dragged in x, in pixels.
+            y_displacement (int): How far the mouse was dragged in y, in pixels.
+
+        """
         x_displacement_normalized, y_displacement_normalized = \
             self.normalize_by_figure_resolution(x_displacement, y_displacement)
 
@@ -1,13 +1,18 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Polygon
+from matplotlib.collections import PolyCollection
 
 
 class Window:
     """ Handles a window shown to the user, including plotting, and displaying
 
+    The artists used for plotting (the wireframe lines and the face collection) are created once and updated in
+    place on each plot_mesh call, since recreating them every animation frame is far more expensive than updating
+    their data.
+
     Attributes:
         fig (matplotlib.pyplot.figure): Internal figure used for plotting
+        ax (matplotlib.axes.Axes): Internal axes used for plotting.
         color (matplotlib.color): Color used when plotting.
 
     """
@@ -23,28 +28,42 @@ class Window:
         """
         self.limit = limit
         self.fig = plt.figure(figsize=figsize, dpi=100)
+        self.ax = self.fig.add_subplot()
+        self.ax.axis('off')
+        self.set_axes_limits()
         self.color = color
 
+        self._face_collection = PolyCollection([], linewidths=0)
+        self.ax.add_collection(self._face_collection)
+        self._vertex_line = None
+        self._edge_lines = None
+        self._background = None
+
     def show(self):
         """ Shows the window """
         plt.show()
 
     def set_axes_limits(self):
         """ Set the axes limits based on self.limit """
-        plt.xlim(-self.limit, self.limit)
-        plt.ylim(-self.limit, self.limit)
+        self.ax.set_xlim(-self.limit, self.limit)
+        self.ax.set_ylim(-self.limit, self.limit)
 
     def clear(self):
-        """ Clears the internal figure and turns the axes off """
-        plt.clf()
-        plt.axis('off')
+        """ Resets the axes limits between frames.
+
+        The axes and artists are persisted across frames rather than cleared, so this only needs to undo any
+        autoscaling before the next plot_mesh call updates the artists in place.
+
+        """
         self.set_axes_limits()
 
     def _plot_wireframe(self, vertices, edges=None, invisible=False):
         """ Plots a wireframe of 2D vertices and edges.
 
+        The Line2D artists are created on the first call and updated via set_data afterwards.
+
         Args:
-            vertices (ndarray): 2 x V ndarray, where V is the number of vertices
+            vertices (ndarray): V x 2 ndarray, where V is the number of vertices
             edges (ndarray): Tuple of two entries: (x, y), where x and y have shape 2 x E. Each column in x and y
                 represents the x / y coordinates of the start and end of the edge.
 
@@ -65,11 +84,16 @@ class Window:
 
         """
         color = (0, 0, 0, 0) if invisible else self.color
+        x, y = edges
 
-        plt.plot(vertices[0, :], vertices[1, :], '.', color=color)
+        if self._vertex_line is None:
+            self._vertex_line, = self.ax.plot(vertices[:, 0], vertices[:, 1], '.', color=color)
+            self._edge_lines = self.ax.plot(x, y, color=color)
+            return
 
-        x, y = edges
-        plt.plot(x, y, color=color)
+        self._vertex_line.set_data(vertices[:, 0], vertices[:, 1])
+        for i, edge_line in enumerate(self._edge_lines):
+            edge_line.set_data(x[:, i], y[:, i])
 
     def plot_mesh(self, mesh, draw_faces=True):
         """ Plots a Mesh object onto the 2D window.
@@ -97,135 +121,134 @@ class Window:
 
         """
         projected_vertices = mesh.project_vertices_onto_window()
-        edges = mesh.get_projected_edges()
+        edges = mesh.get_projected_edges(projected_vertices)
         self._plot_wireframe(projected_vertices, edges, invisible=draw_faces)
 
         if draw_faces:
-            faces = mesh.get_projected_faces()
-            normals = mesh.get_face_normals()
-            face_z_values = mesh.get_face_z_values()
+            faces = mesh.get_projected_faces(projected_vertices)
+            face_z_values, normals = mesh.get_face_render_quantities()
             colors = self._get_face_colors_from_normals(normals)
             self.draw_triangles(faces, colors, render_order_values=face_z_values)
 
-    def get_figure(self):
-        """ Gets the internal figure being used.
+    def enable_blitting(self):
+        """ Enables blitting, so redraws only repaint the mesh artists instead of the whole figure.
 
-        Returns:
-            matplotlib.pyplot.figure for the figure being used.
+        The mesh artists are marked as animated, which excludes them from full canvas draws; whenever a full draw
+        does happen (initial display, window resize), the freshly drawn background is captured so subsequent
+        blit_mesh calls can restore it and paint the artists on top.
 
-        """
-        return self.fig
+        This should be called after the first plot_mesh call, once all mesh artists exist.
 
-    def get_figure_resolution(self):
-        """ Get the resolution of the figure in pixels.
+        """
+        for artist in self._get_mesh_artists():
+            artist.set_animated(True)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
 
-        Uses solution from https://stackoverflow.com/questions/29702424/how-to-get-matplotlib-figure-size#:~:text
+    def blit_mesh(self):
+        """ Redraws only the mesh artists by restoring the saved background and blitting the artists on top.
 
-        Returns:
-            List with two entries: [resolution in x, resolution in y]
+        Falls back to doing nothing if no background has been captured yet; the pending full draw will paint the
+        artists and capture one.
 
         """
-        resolution = self.fig.get_size_inches() * self.fig.dpi
-        return resolution
+        if self._background is None:
+            return
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+        self._draw_mesh_artists()
+        canvas.blit(self.ax.bbox)
+        canvas.flush_events()
 
-    def _compute_projection_norm_with_z_axis(self, normals):
-        """ Computes magnitudes of norm of projection of normal vector onto the z-axis.
+    def _on_draw(self, event):
+        """ Captures the background and paints the mesh artists after every full canvas draw.
 
-         Args:
-             normals (List[ndarray]): List of arrays that have shape (3, 1), each representing a unit-norm normal vector
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): Draw event.
 
-         Returns:
-             List of values that range from 0 to 1, where 0 is when the normal is perpendicular to the z-axis
-             and 1 when the normal is parallel with the z axis.
+        """
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_mesh_artists()
 
-         """
-        normals = np.array(normals)[:, :, 0].T
-        z_axis = np.array([[0], [0], [1]])
-        norms_of_projection_onto_z = np.abs(np.matmul(normals.T, z_axis)[:, 0])
-        return list(norms_of_projection_onto_z)
+    def _draw_mesh_artists(self):
+        """ Draws the mesh artists onto the canvas """
+        for artist in self._get_mesh_artists():
+            self.ax.draw_artist(artist)
 
-    def draw_triangles(self, triangles, colors, render_order_values):
-        """ Draw a list of triangles in order determined by list of input values.
+    def _get_mesh_artists(self):
+        """ Get the artists that change as the mesh moves.
 
-        Args:
-            triangles (List[ndarray]): List of triangle vertices for each face. Each array should have shape (3,2).
-            colors (List[matplotlib.color]): List of colors for each face.
-            render_order_values (List[float]): List of values for each face, where a low / negative value means to render
-                first, and a high / positive value means to render last
+        Returns:
+            List of the artists used to draw the mesh.
 
         """
-        assert len(triangles) == len(colors) == len(render_order_values), 'All input lists should have the same length'
+        artists = [self._face_collection]
+        if self._vertex_line is not None:
+            artists.append(self._vertex_line)
+            artists.extend(self._edge_lines)
+        return artists
 
-        triangles, colors, render_order_values = self._sort_faces_by_render_order_values(triangles, colors,
-                                                                                         render_order_values)
-
-        for triangle, color in zip(triangles, colors):
-            self.draw_triangle(triangle, color)
-
-    def draw_triangle(self, points, color):
-        """ Draw a triangle on the window.
+    def get_figure(self):
+        """ Gets the internal figure being used.
 
-        Args:
-            points (ndarray): Points for the triangle. Should be shape (3,2), where each row is a 2D point of
-                the triangle
-            color (matplotlib.color): Color for the triangle.
+        Returns:
+            matplotlib.pyplot.figure for the figure being used.
 
         """
-        assert points.shape == (3, 2), 'The argument points needs to have shape (3,2)'
-
-        triangle = Polygon(points, color=color)
-        plt.gca().add_patch(triangle)
+        return self.fig
 
-    def _sort_faces_by_render_order_values(self, triangles, colors, render_order_values):
-        """ Reorder the list of faces so the faces in front are rendered last.
+    def get_figure_resolution(self):
+        """ Get the resolution of the figure in pixels.
 
-        Args:
-            triangles (List[ndarray]): List of triangle vertices for each face. Each array should have shape (3,2).
-            colors (List[matplotlib.color]): List of colors for each face.
-            render_order_values (List[float]): List of values for each face, where a low / negative value means to render
-                first, and a high / positive value means to render last
+        Uses solution from https://stackoverflow.com/questions/29702424/how-to-get-matplotlib-figure-size#:~:text
 
         Returns:
-            Input lists sorted in order that they should be rendered.
+            List with two entries: [resolution in x, resolution in y]
+
         """
-        sorted_lists = sorted(zip(triangles, colors, render_order_values), key=lambda x: x[2])
-        triangles, colors, render_order_values = zip(*sorted_lists)
-        return triangles, colors, render_order_values
+        resolution = self.fig.get_size_inches() * self.fig.dpi
+        return resolution
 
-    def _get_face_colors_from_normals(self, normals):
-        """ Get colors for each face based on the normal vectors.
+    def draw_triangles(self, triangles, colors, render_order_values):
+        """ Draw the triangles for each face in order determined by the render order values.
+
+        All faces are drawn by a single PolyCollection, which is created once in __init__ and updated here each
+        frame, so matplotlib makes one draw call instead of one per face. The collection draws its polygons in
+        order, so sorting the faces by their render order values puts the faces in front last.
 
         Args:
-            normals (List[ndarray]): list of normal vectors of shape (3,).
+            triangles (ndarray): Triangle vertices for each face, with shape (F, 3, 2), where each entry along the
+                first axis contains the three 2D points of a face.
+            colors (ndarray): Colors for each face, with shape (F, 4), where each row is an r,g,b,a color.
+            render_order_values (ndarray): Array of values for each face, where a low / negative value means to render
+                first, and a high / positive value means to render last
 
-        Returns:
-            List[matplotlib.color] list of colors.
         """
-        colors = [None] * len(normals)
-        projection_norms = self._compute_projection_norm_with_z_axis(normals)
-        for i, projection_norm in enumerate(projection_norms):
-            color = self._get_face_color_from_projection_norm(projection_norm)
-            colors[i] = color
-        return colors
+        assert len(triangles) == len(colors) == len(render_order_values), 'All inputs should have the same length'
 
-    def _get_face_color_from_projection_norm(self, projection_norm, blue_min=95, blue_max=255):
-        """ Get face color from a projection norm
+        render_order = np.argsort(render_order_values)
+        self._face_collection.set_verts(triangles[render_order])
+        self._face_collection.set_facecolors(colors[render_order])
+
+    def _get_face_colors_from_normals(self, normals, blue_min=95, blue_max=255):
+        """ Get colors for each face based on the normal vectors.
 
-        Linearly interpolates the color from blue_min to blue_max based on the similarity between the normal
-        vector and the z axis (where the z-axis comes out of the page)
+        Linearly interpolates each face's blue value from blue_min to blue_max based on the similarity between its
+        normal vector and the z-axis (where the z-axis comes out of the page), so faces pointing toward the viewer
+        are brighter.
 
         Args:
-            projection_norm (float): value from 0 to 1 for linear interpolation
+            normals (ndarray): Array of shape (F, 3), where each row is a unit-norm normal vector.
             blue_min (int): Minimum blue value (from 0-255). This is the blue value when the face is perpendicular to
                 the z-axis
             blue_max (int): Maximum blue value (from 0-255). This is the blue value when the face is parallel with the
                 z-axis
 
         Returns:
-            r,g,b,a for the color
+            ndarray of shape (F, 4), where each row is an r,g,b,a color.
         """
-
-        blue_value = blue_min + projection_norm * (blue_max - blue_min)
-        blue_value_normalized = blue_value / 255
-
-        return 0.0, 0.0, blue_value_normalized, 1.0
+        projection_norms = np.abs(normals[:, 2])
+        blue_values_normalized = (blue_min + projection_norms * (blue_max - blue_min)) / 255
+        colors = np.zeros((len(normals), 4))
+        colors[:, 2] = blue_values_normalized
+        colors[:, 3] = 1.0
+        return colors